@@ -7,6 +7,37 @@ import math
 pygame.init()
 pygame.mixer.init()
 
+# Precomputed sine table so animation code can avoid repeated math.sin calls.
+# fast_sin(x) is accurate to ~0.002 which is plenty for bobbing/pulsing effects.
+SIN_TABLE_SIZE = 4096
+SIN_TABLE_MASK = SIN_TABLE_SIZE - 1
+SIN_TABLE_SCALE = SIN_TABLE_SIZE / (2 * math.pi)
+try:
+    import numpy as np
+    SIN_TABLE = np.sin(np.linspace(0, 2 * math.pi, SIN_TABLE_SIZE, endpoint=False))
+except ImportError:
+    np = None
+    SIN_TABLE = [math.sin(i * 2 * math.pi / SIN_TABLE_SIZE) for i in range(SIN_TABLE_SIZE)]
+
+def fast_sin(x):
+    """Approximate sin(x) via table lookup"""
+    return SIN_TABLE[int(x * SIN_TABLE_SCALE) & SIN_TABLE_MASK]
+
+def _build_spike_offsets():
+    """Precompute spiky-obstacle vertex offsets from center, one entry per
+    2-degree rotation step (rotation advances 2 degrees per frame)"""
+    table = []
+    for step in range(180):
+        points = []
+        for i in range(8):
+            angle = (i * 45 + step * 2) * math.pi / 180
+            radius = 25 if i % 2 == 0 else 15
+            points.append((radius * math.cos(angle), radius * math.sin(angle)))
+        table.append(points)
+    return table
+
+SPIKE_OFFSETS = _build_spike_offsets()
+
 # Game constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -26,6 +57,10 @@ CYAN = (0, 255, 255)
 DARK_GRAY = (64, 64, 64)
 LIGHT_BLUE = (173, 216, 230)
 
+# Transparent marker color for prerendered colorkey sprites - colorkeyed
+# blits take SDL's fast opaque path instead of per-pixel alpha blending
+COLORKEY = (255, 0, 255)
+
 # Lane positions (3 lanes)
 LANE_WIDTH = SCREEN_WIDTH // 3
 LANE_POSITIONS = [
@@ -34,8 +69,18 @@ LANE_POSITIONS = [
     SCREEN_WIDTH - LANE_WIDTH // 2  # Right lane center
 ]
 
+# Hard cap on live particles so collision bursts can't grow the particle
+# list (and its update/draw cost) without bound
+MAX_PARTICLES = 512
+
 class Player:
     """Player character that can move between 3 lanes"""
+    __slots__ = ('width', 'height', 'current_lane', 'x', 'y', 'move_speed',
+                 'moving', 'target_x', 'bob_offset', 'bob_speed',
+                 'invulnerable', 'invulnerable_timer', 'flash_timer')
+
+    _sprite_cache = {}  # (color, leg_offset) -> prerendered frame
+
     def __init__(self):
         self.width = 40
         self.height = 60
@@ -71,7 +116,7 @@ class Player:
             if game:
                 game.play_sound(game.move_sound)
     
-    def update(self):
+    def update(self, ticks):
         """Update player position for smooth lane switching"""
         if self.moving:
             # Move towards target position
@@ -82,9 +127,9 @@ class Player:
                 self.x += self.move_speed
             else:
                 self.x -= self.move_speed
-        
+
         # Update running animation (bobbing effect)
-        self.bob_offset = math.sin(pygame.time.get_ticks() * self.bob_speed) * 3
+        self.bob_offset = fast_sin(ticks * self.bob_speed) * 3
         
         # Update invulnerability
         if self.invulnerable:
@@ -94,28 +139,39 @@ class Player:
                 self.invulnerable = False
                 self.flash_timer = 0
     
-    def draw(self, screen):
+    @classmethod
+    def _get_sprite(cls, color, leg_offset):
+        """Prerendered body+face+legs frame for this color and leg pose"""
+        key = (color, leg_offset)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((40, 65))
+            sprite.fill(COLORKEY)
+            # Body with border
+            pygame.draw.rect(sprite, color, (0, 0, 40, 60))
+            pygame.draw.rect(sprite, BLACK, (0, 0, 40, 60), 2)
+            # A simple face
+            pygame.draw.circle(sprite, WHITE, (20, 15), 8)
+            pygame.draw.circle(sprite, BLACK, (20, 15), 3)
+            # Running legs
+            pygame.draw.rect(sprite, color, (10 + leg_offset, 50, 8, 15))
+            pygame.draw.rect(sprite, color, (22 - leg_offset, 50, 8, 15))
+            sprite = sprite.convert()
+            sprite.set_colorkey(COLORKEY)
+            cls._sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, screen, ticks):
         """Draw the player with animation and effects"""
-        # Apply bobbing animation
-        draw_y = self.y + self.bob_offset
-        
         # Flash effect when invulnerable
         if self.invulnerable and self.flash_timer % 10 < 5:
             return  # Skip drawing to create flashing effect
-        
-        # Draw player body with gradient effect
+
         player_color = LIGHT_BLUE if self.invulnerable else BLUE
-        pygame.draw.rect(screen, player_color, (self.x, draw_y, self.width, self.height))
-        pygame.draw.rect(screen, BLACK, (self.x, draw_y, self.width, self.height), 2)
-        
-        # Add a simple face
-        pygame.draw.circle(screen, WHITE, (self.x + 20, draw_y + 15), 8)
-        pygame.draw.circle(screen, BLACK, (self.x + 20, draw_y + 15), 3)
-        
-        # Add running legs animation
-        leg_offset = int(math.sin(pygame.time.get_ticks() * 0.3) * 5)
-        pygame.draw.rect(screen, player_color, (self.x + 10 + leg_offset, draw_y + 50, 8, 15))
-        pygame.draw.rect(screen, player_color, (self.x + 22 - leg_offset, draw_y + 50, 8, 15))
+        leg_offset = int(fast_sin(ticks * 0.3) * 5)
+        sprite = self._get_sprite(player_color, leg_offset)
+        # Apply bobbing animation
+        screen.blit(sprite, (self.x, self.y + self.bob_offset))
     
     def get_rect(self):
         """Get collision rectangle"""
@@ -123,16 +179,22 @@ class Player:
 
 class Obstacle:
     """Obstacles that spawn in lanes and move down the screen"""
+    __slots__ = ('width', 'height', 'lane', 'x', 'y', 'speed', 'type', 'rotation')
+
     def __init__(self, lane, obstacle_type="normal"):
         self.width = 50
         self.height = 50
+        self.reset(lane, obstacle_type)
+
+    def reset(self, lane, obstacle_type="normal"):
+        """Reinitialize so a pooled obstacle can be reused"""
         self.lane = lane
         self.x = LANE_POSITIONS[lane] - self.width // 2
         self.y = -self.height  # Start above screen
         self.speed = 8
         self.type = obstacle_type
         self.rotation = 0
-        
+
     def update(self):
         """Move obstacle down the screen"""
         self.y += self.speed
@@ -140,19 +202,14 @@ class Obstacle:
         
     def draw(self, screen):
         """Draw obstacle with different types"""
+        # Newly spawned obstacles sit above the screen for several frames
+        if self.y + self.height < 0 or self.y > SCREEN_HEIGHT:
+            return
         if self.type == "spike":
-            # Draw spiky obstacle
-            points = []
+            # Draw spiky obstacle from the precomputed vertex table
             center_x, center_y = self.x + self.width//2, self.y + self.height//2
-            for i in range(8):
-                angle = (i * 45 + self.rotation) * math.pi / 180
-                if i % 2 == 0:
-                    radius = 25
-                else:
-                    radius = 15
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                points.append((x, y))
+            offsets = SPIKE_OFFSETS[(self.rotation // 2) % 180]
+            points = [(center_x + dx, center_y + dy) for dx, dy in offsets]
             pygame.draw.polygon(screen, RED, points)
             pygame.draw.polygon(screen, BLACK, points, 2)
         else:
@@ -170,30 +227,51 @@ class Obstacle:
 
 class Coin:
     """Collectible coins that give points"""
+    __slots__ = ('width', 'height', 'lane', 'x', 'y', 'speed', 'rotation', 'bob_offset')
+
+    _sprite = None  # Prerendered coin face, shared by all coins
+
     def __init__(self, lane):
         self.width = 30
         self.height = 30
+        self.reset(lane)
+
+    def reset(self, lane):
+        """Reinitialize so a pooled coin can be reused"""
         self.lane = lane
         self.x = LANE_POSITIONS[lane] - self.width // 2
         self.y = -self.height
         self.speed = 8
         self.rotation = 0
         self.bob_offset = 0
-        
-    def update(self):
+
+    def update(self, ticks):
         """Move coin down and animate"""
         self.y += self.speed
         self.rotation += 5
-        self.bob_offset = math.sin(pygame.time.get_ticks() * 0.1) * 2
-        
+        self.bob_offset = fast_sin(ticks * 0.1) * 2
+        
+    @classmethod
+    def _get_sprite(cls):
+        """Prerendered coin surface, built on first use"""
+        if cls._sprite is None:
+            sprite = pygame.Surface((30, 30))
+            sprite.fill(COLORKEY)
+            pygame.draw.circle(sprite, YELLOW, (15, 15), 15)
+            pygame.draw.circle(sprite, ORANGE, (15, 15), 12)
+            pygame.draw.circle(sprite, YELLOW, (15, 15), 8)
+            pygame.draw.circle(sprite, BLACK, (15, 15), 15, 2)
+            sprite = sprite.convert()
+            sprite.set_colorkey(COLORKEY)
+            cls._sprite = sprite
+        return cls._sprite
+
     def draw(self, screen):
         """Draw animated coin"""
-        draw_y = self.y + self.bob_offset
-        # Draw coin with rotation effect
-        pygame.draw.circle(screen, YELLOW, (self.x + 15, draw_y + 15), 15)
-        pygame.draw.circle(screen, ORANGE, (self.x + 15, draw_y + 15), 12)
-        pygame.draw.circle(screen, YELLOW, (self.x + 15, draw_y + 15), 8)
-        pygame.draw.circle(screen, BLACK, (self.x + 15, draw_y + 15), 15, 2)
+        # Skip while fully above/below the screen (2px slack for the bob)
+        if self.y + self.height < -2 or self.y > SCREEN_HEIGHT + 2:
+            return
+        screen.blit(self._get_sprite(), (self.x, self.y + self.bob_offset))
         
     def get_rect(self):
         """Get collision rectangle"""
@@ -205,6 +283,10 @@ class Coin:
 
 class PowerUp:
     """Power-ups that give special abilities"""
+    __slots__ = ('width', 'height', 'lane', 'x', 'y', 'speed', 'type', 'pulse')
+
+    _frame_cache = {}  # (type, pulse_size) -> prerendered frame
+
     def __init__(self, lane, power_type):
         self.width = 40
         self.height = 40
@@ -220,29 +302,45 @@ class PowerUp:
         self.y += self.speed
         self.pulse += 0.2
         
+    @classmethod
+    def _get_frame(cls, power_type, pulse_size):
+        """Prerendered frame for this power-up type and pulse size"""
+        key = (power_type, pulse_size)
+        frame = cls._frame_cache.get(key)
+        if frame is None:
+            # 48x48 canvas centered on the 40x40 power-up so the pulsing
+            # rings have room to grow past its edges
+            frame = pygame.Surface((48, 48))
+            frame.fill(COLORKEY)
+            if power_type == "shield":
+                # Shield power-up (blue)
+                pygame.draw.circle(frame, CYAN, (24, 24), 20 + pulse_size)
+                pygame.draw.circle(frame, BLUE, (24, 24), 15 + pulse_size)
+                pygame.draw.circle(frame, BLACK, (24, 24), 20 + pulse_size, 2)
+            elif power_type == "magnet":
+                # Magnet power-up (purple)
+                pygame.draw.rect(frame, PURPLE, (9, 9, 30, 30))
+                pygame.draw.circle(frame, WHITE, (24, 24), 8)
+                pygame.draw.circle(frame, BLACK, (24, 24), 15, 2)
+            elif power_type == "double_score":
+                # Double score power-up (green) with "2X" text
+                pygame.draw.circle(frame, GREEN, (24, 24), 20 + pulse_size)
+                pygame.draw.circle(frame, WHITE, (24, 24), 15 + pulse_size)
+                font = pygame.font.Font(None, 24)
+                text = font.render("2X", True, BLACK)
+                frame.blit(text, text.get_rect(center=(24, 24)))
+            frame = frame.convert()
+            frame.set_colorkey(COLORKEY)
+            cls._frame_cache[key] = frame
+        return frame
+
     def draw(self, screen):
         """Draw power-up with type-specific appearance"""
-        pulse_size = int(math.sin(self.pulse) * 3)
-        
-        if self.type == "shield":
-            # Shield power-up (blue)
-            pygame.draw.circle(screen, CYAN, (self.x + 20, self.y + 20), 20 + pulse_size)
-            pygame.draw.circle(screen, BLUE, (self.x + 20, self.y + 20), 15 + pulse_size)
-            pygame.draw.circle(screen, BLACK, (self.x + 20, self.y + 20), 20 + pulse_size, 2)
-        elif self.type == "magnet":
-            # Magnet power-up (purple)
-            pygame.draw.rect(screen, PURPLE, (self.x + 5, self.y + 5, 30, 30))
-            pygame.draw.circle(screen, WHITE, (self.x + 20, self.y + 20), 8)
-            pygame.draw.circle(screen, BLACK, (self.x + 20, self.y + 20), 15, 2)
-        elif self.type == "double_score":
-            # Double score power-up (green)
-            pygame.draw.circle(screen, GREEN, (self.x + 20, self.y + 20), 20 + pulse_size)
-            pygame.draw.circle(screen, WHITE, (self.x + 20, self.y + 20), 15 + pulse_size)
-            # Draw "2X" text
-            font = pygame.font.Font(None, 24)
-            text = font.render("2X", True, BLACK)
-            text_rect = text.get_rect(center=(self.x + 20, self.y + 20))
-            screen.blit(text, text_rect)
+        # Skip while fully offscreen (4px slack for the pulsing rings)
+        if self.y + self.height < -4 or self.y > SCREEN_HEIGHT + 4:
+            return
+        pulse_size = int(fast_sin(self.pulse) * 3)
+        screen.blit(self._get_frame(self.type, pulse_size), (self.x - 4, self.y - 4))
         
     def get_rect(self):
         """Get collision rectangle"""
@@ -254,7 +352,15 @@ class PowerUp:
 
 class Particle:
     """Particle effects for visual enhancement"""
+    __slots__ = ('x', 'y', 'color', 'velocity_x', 'velocity_y', 'life', 'max_life')
+
+    _atlas = {}  # color -> fading frames indexed by remaining life (1..30)
+
     def __init__(self, x, y, color, velocity_x=0, velocity_y=0):
+        self.reset(x, y, color, velocity_x, velocity_y)
+
+    def reset(self, x, y, color, velocity_x=0, velocity_y=0):
+        """Reinitialize so a pooled particle can be reused"""
         self.x = x
         self.y = y
         self.color = color
@@ -262,19 +368,34 @@ class Particle:
         self.velocity_y = velocity_y
         self.life = 30
         self.max_life = 30
-        
+
     def update(self):
         """Update particle position and life"""
         self.x += self.velocity_x
         self.y += self.velocity_y
         self.life -= 1
         
+    @classmethod
+    def _get_atlas(cls, color):
+        """Prerendered shrinking/fading frames for this color, one per life
+        step (particles always start at 30 life)"""
+        frames = cls._atlas.get(color)
+        if frames is None:
+            frames = [None]  # Life 0 is never drawn
+            for life in range(1, 31):
+                alpha = int(255 * (life / 30))
+                size = max(1, int(5 * (life / 30)))
+                frame = pygame.Surface((10, 10), pygame.SRCALPHA)
+                pygame.draw.circle(frame, color + (alpha,), (5, 5), size)
+                frames.append(frame.convert_alpha())
+            cls._atlas[color] = frames
+        return frames
+
     def draw(self, screen):
         """Draw particle with fading effect"""
         if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            size = max(1, int(5 * (self.life / self.max_life)))
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
+            screen.blit(self._get_atlas(self.color)[self.life],
+                        (int(self.x) - 5, int(self.y) - 5))
     
     def is_dead(self):
         """Check if particle should be removed"""
@@ -286,14 +407,30 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Subway Runner - Enhanced Endless Runner")
         self.clock = pygame.time.Clock()
-        
+        self._ticks = pygame.time.get_ticks()  # Cached once per frame in update_game
+        self._player_center_x = SCREEN_WIDTH // 2  # Refreshed every update_game
+        self._player_center_y = SCREEN_HEIGHT - 120
+
         # Game objects
         self.player = Player()
         self.obstacles = []
         self.coins = []
         self.power_ups = []
         self.particles = []
-        
+
+        # Free lists of dead entities, reused on spawn to avoid per-spawn
+        # allocation and GC churn
+        self._obstacle_pool = []
+        self._coin_pool = []
+        self._particle_pool = []
+        self._particle_cursor = 0  # Overwrite position once MAX_PARTICLES is hit
+
+        # Precomputed random rings - one bulk generation amortizes thousands
+        # of scalar random.* calls made by the spawn helpers
+        self._rand_size = 4096
+        self._refill_rand_lanes()
+        self._refill_rand_units()
+
         # Game state
         self.score = 0
         self.coins_collected = 0
@@ -318,10 +455,40 @@ class Game:
         self.double_score_active = False
         self.double_score_timer = 0
         
+        # Prerendered scrolling road: GRAY fill plus every lane-divider dash,
+        # drawn once; draw_background just blits it at the scroll offset.
+        # One extra 40px dash period of height gives the wraparound room.
+        self._road_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT + 40)).convert()
+        self._road_bg.fill(GRAY)
+        for i in range(1, 3):  # 2 divider lines for 3 lanes
+            x = i * LANE_WIDTH
+            for y in range(0, SCREEN_HEIGHT + 40, 40):
+                pygame.draw.rect(self._road_bg, WHITE, (x - 2, y, 4, 20))
+
         # Font for text
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.big_font = pygame.font.Font(None, 72)
+
+        # Text render caches: font.render is one of the slowest per-frame
+        # pygame calls, so each label keeps its last rendered string (one
+        # slot per label, re-rendered only when the string changes) and the
+        # always-changing score value is blitted from prerendered digit glyphs
+        self._label_cache = {}
+        self._score_label = self.font.render("Score: ", True, WHITE)
+        self._score_digits = [self.font.render(d, True, WHITE) for d in "0123456789"]
+
+        # Semi-transparent game-over overlay, allocated once instead of a
+        # full-screen surface per frame while the game-over screen shows
+        self._gameover_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._gameover_overlay.set_alpha(128)
+        self._gameover_overlay.fill(BLACK)
+        self._gameover_drawn = False
+
+        self._gameover_frame = None  # Saved copy of the composed game-over screen
+
+        # Magnet field ring frames, prerendered lazily per pulse step
+        self._magnet_frames = {}
         
         # Initialize sound system with working audio
         self.sound_enabled = True
@@ -355,64 +522,53 @@ class Game:
     
     def create_beep_sound(self, frequency, duration):
         """Create a simple beep sound with proper 2D array format"""
+        if np is None:
+            print("NumPy not available, using basic sound generation")
+            return self.create_basic_beep(frequency, duration)
         try:
-            import numpy as np
-            
             # Audio parameters
             sample_rate = 22050
             frames = int(duration * sample_rate)
-            
-            # Generate time array
-            t = np.linspace(0, duration, frames, False)
-            
-            # Generate sine wave
-            wave = np.sin(frequency * 2 * np.pi * t)
-            
-            # Convert to 16-bit integers
-            wave = (wave * 16000).astype(np.int16)
-            
-            # Create stereo array (2D: frames x 2 channels)
-            stereo_wave = np.column_stack((wave, wave))
-            
+
+            # Synthesize the sine in place in a single float32 scratch buffer,
+            # then write both channels of one int16 stereo buffer - no
+            # float64 wave or column_stack intermediates
+            phase = np.arange(frames, dtype=np.float32)
+            phase *= frequency * 2 * np.pi / sample_rate
+            np.sin(phase, out=phase)
+            phase *= 16000
+
+            stereo_wave = np.empty((frames, 2), dtype=np.int16)
+            stereo_wave[:, 0] = phase
+            stereo_wave[:, 1] = stereo_wave[:, 0]
+
             # Create pygame sound
             sound = pygame.sndarray.make_sound(stereo_wave)
             return sound
-            
-        except ImportError:
-            print("NumPy not available, using basic sound generation")
-            return self.create_basic_beep(frequency, duration)
+
         except Exception as e:
             print(f"Sound creation error: {e}")
             return None
-    
+
     def create_basic_beep(self, frequency, duration):
-        """Fallback sound creation without NumPy"""
+        """Fallback sound creation - a short enveloped click"""
         try:
-            # Create a simple click sound as fallback
             sample_rate = 22050
             frames = int(0.05 * sample_rate)  # Short click
-            
-            # Create 2D array manually
-            sound_array = []
-            for i in range(frames):
-                # Simple envelope to avoid clicks
-                if i < frames // 4:
-                    amplitude = i / (frames // 4)
-                elif i > 3 * frames // 4:
-                    amplitude = (frames - i) / (frames // 4)
-                else:
-                    amplitude = 1.0
-                
-                value = int(8000 * amplitude)
-                sound_array.append([value, value])  # [left, right]
-            
-            # Convert to numpy array for pygame
-            import numpy as np
-            stereo_array = np.array(sound_array, dtype=np.int16)
-            
+
+            # Trapezoid envelope (quarter-length ramps to avoid clicks),
+            # computed in bulk instead of a per-sample Python loop
+            ramp = frames // 4
+            idx = np.arange(frames, dtype=np.float32)
+            amplitude = np.minimum(np.minimum(idx, frames - idx) / ramp, 1.0)
+
+            stereo_array = np.empty((frames, 2), dtype=np.int16)
+            stereo_array[:, 0] = amplitude * 8000
+            stereo_array[:, 1] = stereo_array[:, 0]
+
             sound = pygame.sndarray.make_sound(stereo_array)
             return sound
-            
+
         except Exception as e:
             print(f"Basic sound creation error: {e}")
             return None
@@ -444,31 +600,86 @@ class Game:
         
         return True
     
+    def _refill_rand_lanes(self):
+        """Regenerate the ring of random lane indices in bulk"""
+        if np is not None:
+            self._rand_lanes = np.random.randint(0, 3, size=self._rand_size)
+        else:
+            self._rand_lanes = [random.randint(0, 2) for _ in range(self._rand_size)]
+        self._rand_lane_index = 0
+
+    def _refill_rand_units(self):
+        """Regenerate the ring of random floats in [0, 1) in bulk"""
+        if np is not None:
+            self._rand_units = np.random.random(self._rand_size)
+        else:
+            self._rand_units = [random.random() for _ in range(self._rand_size)]
+        self._rand_unit_index = 0
+
+    def _next_lane(self):
+        """Next precomputed random lane (0, 1 or 2)"""
+        lane = int(self._rand_lanes[self._rand_lane_index])
+        self._rand_lane_index += 1
+        if self._rand_lane_index == self._rand_size:
+            self._refill_rand_lanes()
+        return lane
+
+    def _next_unit(self):
+        """Next precomputed random float in [0, 1)"""
+        u = self._rand_units[self._rand_unit_index]
+        self._rand_unit_index += 1
+        if self._rand_unit_index == self._rand_size:
+            self._refill_rand_units()
+        return u
+
     def spawn_obstacle(self):
         """Spawn a new obstacle in a random lane"""
-        lane = random.randint(0, 2)  # Random lane (0, 1, or 2)
+        lane = self._next_lane()
         # 20% chance for spike obstacle
-        obstacle_type = "spike" if random.random() < 0.2 else "normal"
-        self.obstacles.append(Obstacle(lane, obstacle_type))
-    
+        obstacle_type = "spike" if self._next_unit() < 0.2 else "normal"
+        if self._obstacle_pool:
+            obstacle = self._obstacle_pool.pop()
+            obstacle.reset(lane, obstacle_type)
+        else:
+            obstacle = Obstacle(lane, obstacle_type)
+        self.obstacles.append(obstacle)
+
     def spawn_coin(self):
         """Spawn a coin in a random lane"""
-        lane = random.randint(0, 2)
-        self.coins.append(Coin(lane))
+        lane = self._next_lane()
+        if self._coin_pool:
+            coin = self._coin_pool.pop()
+            coin.reset(lane)
+        else:
+            coin = Coin(lane)
+        self.coins.append(coin)
     
     def spawn_powerup(self):
         """Spawn a random power-up"""
-        lane = random.randint(0, 2)
+        lane = self._next_lane()
         power_types = ["shield", "magnet", "double_score"]
-        power_type = random.choice(power_types)
+        power_type = power_types[int(self._next_unit() * 3)]
         self.power_ups.append(PowerUp(lane, power_type))
     
     def create_particles(self, x, y, color, count=5):
         """Create particle effects at given position"""
         for _ in range(count):
-            vel_x = random.uniform(-3, 3)
-            vel_y = random.uniform(-3, 3)
-            self.particles.append(Particle(x, y, color, vel_x, vel_y))
+            vel_x = self._next_unit() * 6 - 3
+            vel_y = self._next_unit() * 6 - 3
+            if len(self.particles) >= MAX_PARTICLES:
+                # At the cap: recycle a live particle in place, rotating
+                # through the slots so the oldest get overwritten first
+                # (particles age in insertion order)
+                if self._particle_cursor >= len(self.particles):
+                    self._particle_cursor = 0
+                self.particles[self._particle_cursor].reset(x, y, color, vel_x, vel_y)
+                self._particle_cursor += 1
+            elif self._particle_pool:
+                particle = self._particle_pool.pop()
+                particle.reset(x, y, color, vel_x, vel_y)
+                self.particles.append(particle)
+            else:
+                self.particles.append(Particle(x, y, color, vel_x, vel_y))
     
     def activate_powerup(self, power_type):
         """Activate a power-up effect"""
@@ -488,39 +699,77 @@ class Game:
     
     def update_game(self):
         """Update all game objects"""
+        self._ticks = pygame.time.get_ticks()
         if self.game_over:
             return
-            
+
         # Update player
-        self.player.update()
-        
-        # Update obstacles
-        for obstacle in self.obstacles[:]:
+        self.player.update(self._ticks)
+
+        # Update obstacles, compacting survivors in place (list.remove would
+        # rescan the whole list per removal, O(n^2) across a frame). These
+        # loops bind lists/pools to locals so each iteration skips the
+        # repeated self.* lookups.
+        passed = 0
+        write = 0
+        obstacles = self.obstacles
+        recycle_obstacle = self._obstacle_pool.append
+        for obstacle in obstacles:
             obstacle.update()
-            if obstacle.is_off_screen():
-                self.obstacles.remove(obstacle)
-                score_gain = 10
-                if self.double_score_active:
-                    score_gain *= 2
-                self.score += score_gain
-        
+            if obstacle.y > SCREEN_HEIGHT:  # Inlined is_off_screen()
+                passed += 1
+                recycle_obstacle(obstacle)
+            else:
+                obstacles[write] = obstacle
+                write += 1
+        del obstacles[write:]
+        if passed:
+            score_gain = 10 * passed
+            if self.double_score_active:
+                score_gain *= 2
+            self.score += score_gain
+
         # Update coins
-        for coin in self.coins[:]:
-            coin.update()
-            if coin.is_off_screen():
-                self.coins.remove(coin)
-        
+        write = 0
+        ticks = self._ticks
+        coins = self.coins
+        recycle_coin = self._coin_pool.append
+        for coin in coins:
+            coin.update(ticks)
+            if coin.y > SCREEN_HEIGHT:  # Inlined is_off_screen()
+                recycle_coin(coin)
+            else:
+                coins[write] = coin
+                write += 1
+        del coins[write:]
+
         # Update power-ups
-        for powerup in self.power_ups[:]:
+        write = 0
+        power_ups = self.power_ups
+        for powerup in power_ups:
             powerup.update()
-            if powerup.is_off_screen():
-                self.power_ups.remove(powerup)
-        
+            if powerup.y <= SCREEN_HEIGHT:  # Inlined is_off_screen()
+                power_ups[write] = powerup
+                write += 1
+        del power_ups[write:]
+
         # Update particles
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.is_dead():
-                self.particles.remove(particle)
+        write = 0
+        particles = self.particles
+        recycle_particle = self._particle_pool.append
+        for particle in particles:
+            # Inlined Particle.update/is_dead: with hundreds of live
+            # particles the two method calls per particle cost more than
+            # the arithmetic itself
+            particle.x += particle.velocity_x
+            particle.y += particle.velocity_y
+            particle.life -= 1
+            if particle.life <= 0:
+                recycle_particle(particle)
+            else:
+                particles[write] = particle
+                write += 1
+        del particles[write:]
         
         # Spawn new obstacles
         self.obstacle_spawn_timer += 1
@@ -558,11 +807,23 @@ class Game:
             if self.double_score_timer <= 0:
                 self.double_score_active = False
         
-        # Check collisions
+        # Check collisions; the player rect and center are fixed for the
+        # rest of the frame, so compute them once here (draw reuses the
+        # center for the magnet field)
         player_rect = self.player.get_rect()
-        
+        self._player_center_x = self.player.x + self.player.width // 2
+        self._player_center_y = self.player.y + self.player.height // 2
+
+        # Lanes the player's rect currently spans (two during a lane-switch
+        # animation); entities in other lanes cannot collide, so their rect
+        # tests are skipped outright
+        lane_lo = max(0, player_rect.left // LANE_WIDTH)
+        lane_hi = min(2, (player_rect.right - 1) // LANE_WIDTH)
+
         # Obstacle collisions
-        for obstacle in self.obstacles[:]:
+        for i, obstacle in enumerate(self.obstacles):
+            if obstacle.lane < lane_lo or obstacle.lane > lane_hi:
+                continue
             if player_rect.colliderect(obstacle.get_rect()):
                 if not self.player.invulnerable:
                     self.game_over = True
@@ -571,47 +832,64 @@ class Game:
                     if self.score > self.high_score:
                         self.high_score = self.score
                 else:
-                    # Destroy obstacle if player is invulnerable
-                    self.obstacles.remove(obstacle)
+                    # Destroy obstacle if player is invulnerable; delete by
+                    # index rather than list.remove's equality rescan
+                    del self.obstacles[i]
+                    self._obstacle_pool.append(obstacle)
                     self.create_particles(obstacle.x + 25, obstacle.y + 25, CYAN, 8)
                 break
         
         # Coin collisions
-        for coin in self.coins[:]:
-            coin_rect = coin.get_rect()
+        player_center_x = self._player_center_x
+        player_center_y = self._player_center_y
+        write = 0
+        for coin in self.coins:
+            # Lane filter: magnet-attracted coins leave their lane (marked
+            # with lane -1) and are always tested; while the magnet is active
+            # every coin is visited anyway for the attraction pass
+            if not self.magnet_active and coin.lane >= 0 and (
+                    coin.lane < lane_lo or coin.lane > lane_hi):
+                self.coins[write] = coin
+                write += 1
+                continue
             collected = False
-            
+
             # Magnet effect - attract coins
             if self.magnet_active:
-                player_center_x = self.player.x + self.player.width // 2
-                player_center_y = self.player.y + self.player.height // 2
                 coin_center_x = coin.x + coin.width // 2
                 coin_center_y = coin.y + coin.height // 2
-                
+
                 dx = player_center_x - coin_center_x
                 dy = player_center_y - coin_center_y
-                distance = math.sqrt(dx*dx + dy*dy)
-                
+                # Compare squared distances so the common cases need no sqrt
+                dist_sq = dx*dx + dy*dy
+
                 # Much larger magnet range and stronger attraction
-                if distance < 200:  # Increased magnet range
+                if dist_sq < 40000:  # Within 200px magnet range
                     # Auto-collect if within collection radius
-                    if distance < 80:  # Larger auto-collection radius
+                    if dist_sq < 6400:  # Within 80px auto-collection radius
                         collected = True
                         # Play magnet collection sound
-                        if random.random() < 0.3:  # 30% chance to avoid spam
+                        if self._next_unit() < 0.3:  # 30% chance to avoid spam
                             self.play_sound(self.magnet_sound)
-                    elif distance > 0:  # Attract if not collected yet
-                        # Much stronger attraction that scales with distance
-                        attraction_strength = min(1.5, 3.0 / (distance / 50))  # Stronger when closer
+                    elif dist_sq > 0:  # Attract if not collected yet
+                        # Much stronger attraction that scales with distance:
+                        # min(1.5, 150/distance) caps out inside 100px
+                        if dist_sq <= 10000:
+                            attraction_strength = 1.5
+                        else:
+                            attraction_strength = 150.0 / math.sqrt(dist_sq)
                         coin.x += dx * attraction_strength
                         coin.y += dy * attraction_strength
-                        
+                        coin.lane = -1  # No longer lane-bound
+
                         # Create continuous magnet particle effects
                         self.create_particles(coin_center_x, coin_center_y, PURPLE, 3)
             
-            # Normal collision detection or magnet collection
-            if collected or player_rect.colliderect(coin_rect):
-                self.coins.remove(coin)
+            # Normal collision detection or magnet collection; survivors are
+            # compacted in place instead of list.remove per collection
+            if collected or player_rect.colliderect(coin.get_rect()):
+                self._coin_pool.append(coin)
                 self.coins_collected += 1
                 score_gain = 50
                 if self.double_score_active:
@@ -619,14 +897,23 @@ class Game:
                 self.score += score_gain
                 self.play_sound(self.coin_sound)
                 self.create_particles(coin.x + 15, coin.y + 15, YELLOW, 6)
-        
-        # Power-up collisions
-        for powerup in self.power_ups[:]:
-            if player_rect.colliderect(powerup.get_rect()):
-                self.power_ups.remove(powerup)
+            else:
+                self.coins[write] = coin
+                write += 1
+        del self.coins[write:]
+
+        # Power-up collisions (same in-place compaction)
+        write = 0
+        for powerup in self.power_ups:
+            if (powerup.lane < lane_lo or powerup.lane > lane_hi
+                    or not player_rect.colliderect(powerup.get_rect())):
+                self.power_ups[write] = powerup
+                write += 1
+            else:
                 self.activate_powerup(powerup.type)
                 self.play_sound(self.powerup_sound)
                 self.create_particles(powerup.x + 20, powerup.y + 20, GREEN, 8)
+        del self.power_ups[write:]
         
         # Update background scroll position
         self.background_y += 5
@@ -641,66 +928,70 @@ class Game:
     
     def draw_background(self):
         """Draw scrolling background with lane lines"""
-        # Fill background
-        self.screen.fill(GRAY)
-        
-        # Draw lane dividers
-        for i in range(1, 3):  # Draw 2 divider lines for 3 lanes
-            x = i * LANE_WIDTH
-            # Draw dashed lines that scroll
-            for y in range(-20, SCREEN_HEIGHT + 20, 40):
-                line_y = (y + self.background_y) % (SCREEN_HEIGHT + 40) - 20
-                pygame.draw.rect(self.screen, WHITE, (x - 2, line_y, 4, 20))
+        # The dash pattern repeats every 40px, so scrolling is just blitting
+        # the prerendered road at the right phase offset
+        self.screen.blit(self._road_bg, (0, self.background_y % 40 - 40))
     
+    def _render_label(self, label, font, text, color):
+        """Render a label's text, reusing the last surface until the string
+        changes (one cache slot per label, so memory stays bounded)"""
+        cached = self._label_cache.get(label)
+        if cached is None or cached[0] != text:
+            cached = (text, font.render(text, True, color))
+            self._label_cache[label] = cached
+        return cached[1]
+
     def draw_ui(self):
         """Draw user interface elements"""
-        # Draw score and stats
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-        
-        coins_text = self.small_font.render(f"Coins: {self.coins_collected}", True, YELLOW)
+        # Draw score from prerendered digit glyphs (the value changes every
+        # frame, so a whole-string cache would never hit)
+        self.screen.blit(self._score_label, (10, 10))
+        x = 10 + self._score_label.get_width()
+        for digit in str(self.score):
+            glyph = self._score_digits[ord(digit) - 48]
+            self.screen.blit(glyph, (x, 10))
+            x += glyph.get_width()
+
+        coins_text = self._render_label("coins", self.small_font, f"Coins: {self.coins_collected}", YELLOW)
         self.screen.blit(coins_text, (10, 50))
-        
-        high_score_text = self.small_font.render(f"High Score: {self.high_score}", True, WHITE)
+
+        high_score_text = self._render_label("high_score", self.small_font, f"High Score: {self.high_score}", WHITE)
         self.screen.blit(high_score_text, (10, 75))
-        
+
         # Draw active power-ups
         y_offset = 100
         if self.shield_active:
-            shield_text = self.small_font.render(f"Shield: {self.shield_timer // 60 + 1}s", True, CYAN)
+            shield_text = self._render_label("shield", self.small_font, f"Shield: {self.shield_timer // 60 + 1}s", CYAN)
             self.screen.blit(shield_text, (10, y_offset))
             y_offset += 25
-        
+
         if self.magnet_active:
-            magnet_text = self.small_font.render(f"Magnet: {self.magnet_timer // 60 + 1}s", True, PURPLE)
+            magnet_text = self._render_label("magnet", self.small_font, f"Magnet: {self.magnet_timer // 60 + 1}s", PURPLE)
             self.screen.blit(magnet_text, (10, y_offset))
             y_offset += 25
-        
+
         if self.double_score_active:
-            double_text = self.small_font.render(f"2X Score: {self.double_score_timer // 60 + 1}s", True, GREEN)
+            double_text = self._render_label("double", self.small_font, f"2X Score: {self.double_score_timer // 60 + 1}s", GREEN)
             self.screen.blit(double_text, (10, y_offset))
-        
+
         # Draw controls hint
-        controls_text = self.small_font.render("Use A/D or Arrow Keys to move", True, WHITE)
+        controls_text = self._render_label("controls", self.small_font, "Use A/D or Arrow Keys to move", WHITE)
         self.screen.blit(controls_text, (10, SCREEN_HEIGHT - 50))
-        
+
         # Draw legend
-        legend_text = self.small_font.render("Collect coins, avoid obstacles, grab power-ups!", True, WHITE)
+        legend_text = self._render_label("legend", self.small_font, "Collect coins, avoid obstacles, grab power-ups!", WHITE)
         self.screen.blit(legend_text, (10, SCREEN_HEIGHT - 25))
         
         if self.game_over:
-            # Draw semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
-            
-            # Draw game over screen
-            game_over_text = self.big_font.render("GAME OVER!", True, RED)
-            final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-            coins_final_text = self.font.render(f"Coins Collected: {self.coins_collected}", True, YELLOW)
-            high_score_final_text = self.font.render(f"High Score: {self.high_score}", True, WHITE)
-            restart_text = self.font.render("Press SPACE to restart", True, WHITE)
+            # Draw semi-transparent overlay (preallocated)
+            self.screen.blit(self._gameover_overlay, (0, 0))
+
+            # Draw game over screen; these strings only change once per death
+            game_over_text = self._render_label("go_title", self.big_font, "GAME OVER!", RED)
+            final_score_text = self._render_label("go_score", self.font, f"Final Score: {self.score}", WHITE)
+            coins_final_text = self._render_label("go_coins", self.font, f"Coins Collected: {self.coins_collected}", YELLOW)
+            high_score_final_text = self._render_label("go_high", self.font, f"High Score: {self.high_score}", WHITE)
+            restart_text = self._render_label("go_restart", self.font, "Press SPACE to restart", WHITE)
             
             # Center the text
             game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
@@ -717,44 +1008,74 @@ class Game:
     
     def draw(self):
         """Draw all game elements"""
+        # The game-over screen is completely static: compose it once, then
+        # just re-present the saved frame. Flipping must continue every
+        # frame - window contents are not guaranteed to survive occlusion
+        # or alt-tab, so the display still needs repainting
+        if self.game_over:
+            if self._gameover_drawn:
+                self.screen.blit(self._gameover_frame, (0, 0))
+                pygame.display.flip()
+                return
+            self._gameover_drawn = True
+
         # Draw background
         self.draw_background()
         
         # Draw particles (behind everything)
+        screen = self.screen
         for particle in self.particles:
-            particle.draw(self.screen)
+            particle.draw(screen)
         
         # Draw magnet field effect (behind player)
         if self.magnet_active and not self.game_over:
-            player_center_x = self.player.x + self.player.width // 2
-            player_center_y = self.player.y + self.player.height // 2
-            # Draw pulsing magnet field
-            pulse = int(math.sin(pygame.time.get_ticks() * 0.01) * 20)
-            pygame.draw.circle(self.screen, (128, 0, 128, 50), (player_center_x, player_center_y), 100 + pulse, 3)
-            pygame.draw.circle(self.screen, (128, 0, 128, 30), (player_center_x, player_center_y), 150 + pulse, 2)
+            # Pulsing field rings, prerendered once per pulse step on an
+            # alpha surface; drawing circles straight to the screen ignored
+            # the alpha in the color tuple, so the rings never actually
+            # showed translucent
+            pulse = int(fast_sin(self._ticks * 0.01) * 20)
+            frame = self._magnet_frames.get(pulse)
+            if frame is None:
+                frame = pygame.Surface((348, 348), pygame.SRCALPHA)
+                pygame.draw.circle(frame, (128, 0, 128, 50), (174, 174), 100 + pulse, 3)
+                pygame.draw.circle(frame, (128, 0, 128, 30), (174, 174), 150 + pulse, 2)
+                frame = frame.convert_alpha()
+                self._magnet_frames[pulse] = frame
+            screen.blit(frame, (self._player_center_x - 174,
+                                self._player_center_y - 174))
         
         # Draw game objects
         if not self.game_over:
-            self.player.draw(self.screen)
+            self.player.draw(self.screen, self._ticks)
             
         for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
-            
+            obstacle.draw(screen)
+
         for coin in self.coins:
-            coin.draw(self.screen)
-            
+            coin.draw(screen)
+
         for powerup in self.power_ups:
-            powerup.draw(self.screen)
+            powerup.draw(screen)
         
         # Draw UI
         self.draw_ui()
-        
+
+        # Keep a copy of the freshly composed game-over screen for the
+        # re-present path above (only reached on its first frame)
+        if self.game_over:
+            self._gameover_frame = self.screen.copy()
+
         # Update display
         pygame.display.flip()
     
     def restart_game(self):
         """Reset game to initial state"""
         self.player = Player()
+        # Recycle whatever was live when the run ended
+        self._obstacle_pool.extend(self.obstacles)
+        self._coin_pool.extend(self.coins)
+        self._particle_pool.extend(self.particles)
+        self._particle_cursor = 0
         self.obstacles = []
         self.coins = []
         self.power_ups = []
@@ -764,6 +1085,7 @@ class Game:
         self.score = 0
         self.coins_collected = 0
         self.game_over = False
+        self._gameover_drawn = False
         self.background_y = 0
         self.speed_multiplier = 1.0
         